@@ -8,7 +8,7 @@ def main():
     # Load configuration
     config = Config()
 
-    # Choose storage backend: "sqlite", "json", or "csv"
+    # Choose storage backend: "parquet", "sqlite", "json", or "csv"
     storage_type = config.storage_type  # Change this to switch storage backends
 
     # Create and run pipeline
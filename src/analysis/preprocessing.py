@@ -0,0 +1,25 @@
+"""Text preprocessing shared by data collection and analysis"""
+import re
+
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_WS_RE = re.compile(r'\s+')
+
+
+def remove_parentheses(text: str) -> str:
+    """
+    Remove all text in parentheses (including parentheses).
+    Also removes any leading/trailing whitespace that may remain.
+    """
+    cleaned = _PAREN_RE.sub('', text)
+    # Remove extra spaces that may result from removal
+    cleaned = _WS_RE.sub(' ', cleaned)
+    return cleaned.strip()
+
+
+def clean_text(text: str) -> str:
+    """
+    Prepare statement text for NLP.
+    Remove text in parentheses (e.g. applause, interjections) and convert to lowercase.
+    Output is stored as content_clean_v1, bump the version when it changes.
+    """
+    return remove_parentheses(text).lower()
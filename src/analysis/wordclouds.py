@@ -1,92 +1,214 @@
 # %%
 import spacy
 import re
-import pandas as pd
+from collections import Counter
+import numpy as np
+from pathlib import Path
+import polars as pl
+from spacy.attrs import POS, IS_STOP, IS_PUNCT, IS_SPACE, LEMMA
+from spacy.parts_of_speech import NOUN, PROPN, ADJ
+from spacy.tokens import DocBin
 from wordcloud import WordCloud
 import matplotlib.pyplot as plt
 
+_WORD_RE = re.compile(r'[a-ząćęłńóśźż]{4,}')
+_KEEP_POS = np.array([NOUN, PROPN, ADJ], dtype=np.uint64)
 
-# %%
-# Load data and nlp model
-df = pd.read_csv('../../data/statements.csv')
-nlp = spacy.load("pl_core_news_sm")
-df.head()
+# Parquet dataset written by the default storage backend,
+# point to '../../data/statements.csv' when collecting with the CSV backend
+DATA_PATH = Path('../../data/statements.parquet')
+CACHE_DIR = Path('../../data/cache')
+OUTPUT_DIR = Path('../../data/wordclouds')
+
+
+def scan_statements(path):
+    """
+    Lazily scan statements stored by the Parquet or CSV storage backend.
+    CSV columns are all read as strings, skipping schema inference.
+    """
+    if path.suffix == '.csv':
+        return pl.scan_csv(path, infer_schema=False)
+    return pl.scan_parquet(path / '**' / '*.parquet', hive_partitioning=True)
+
+
+def source_key(path):
+    """Identify the current version of the statements files by their mtime and size"""
+    files = [path] if path.is_file() else sorted(path.rglob('*.parquet'))
+    stats = [file.stat() for file in files]
+    latest = max((stat.st_mtime_ns for stat in stats), default=0)
+    return f"{len(stats)}-{latest}-{sum(stat.st_size for stat in stats)}"
+
+
+def with_clean_text(lf):
+    """
+    Fill content_clean_v1 for statements collected before it was stored.
+    Mirrors preprocessing.clean_text with vectorized expressions, content_text is only
+    read when the column is missing or has nulls.
+    """
+    cleaned = (
+        pl.col("content_text")
+        .str.replace_all(r"\([^)]*\)", "")
+        .str.replace_all(r"\s+", " ")
+        .str.strip_chars()
+        .str.to_lowercase()
+    )
+    if "content_clean_v1" not in lf.collect_schema().names():
+        return lf.with_columns(cleaned.alias("content_clean_v1"))
+    if lf.select(pl.col("content_clean_v1").null_count()).collect().item() == 0:
+        return lf
+    return lf.with_columns(pl.coalesce("content_clean_v1", cleaned).alias("content_clean_v1"))
 
-# %%
-df.info(verbose=True)
 
 # %%
-# Data has some incorrect types, convert
-dfn = df.convert_dtypes()
-dfn.dtypes
+# Scan data lazily, only needed columns are read when a query is collected.
+# content_clean_v1 is cleaned during collection (parentheses removed, lowercase)
+lf = (
+    with_clean_text(scan_statements(DATA_PATH))
+    .select(["unique_id", "speaker_name", "content_clean_v1"])
+)
+# Only lemmas and POS tags are used, skip the dependency parser and NER
+nlp = spacy.load("pl_core_news_sm", disable=["parser", "ner"])
+lf.head().collect()
 
 # %%
-# Remove unneeded columns
-dfn = dfn[["unique_id", "speaker_name", "content_text"]]
-dfn.head()
+lf.collect_schema()
 
 # %%
 # See the most frequent speakers
-speaker = dfn.groupby("speaker_name")
-# speaker.describe().head()
-
-speaker.count().sort_values(by="content_text", ascending=False).head()
+lf.group_by("speaker_name").len().sort("len", descending=True).head().collect()
 
 # %%
 # Get text string from selected row
-dfn_row = dfn.iloc[[42]]
-raw_text = dfn_row["content_text"].values[0]
+row_text = lf.slice(42, 1).collect()["content_clean_v1"][0]
 
 # %%
 # Clean text with Spacy
 def process_text(text):
     """
     Initial text processing.
-    Convert to lowercase, remove text in parentheses and lemmatize.
+    Lemmatize cleaned text and keep nouns, proper nouns and adjectives.
     """
+    return process_texts([text])
 
-    doc = remove_parentheses(text)
 
-    doc = nlp(doc.lower())
+def process_texts(texts, batch_size=64, n_process=1):
+    """
+    Initial text processing of many texts at once.
+    Texts are streamed through nlp.pipe in batches,
+    lemmas of all texts are joined into a single string.
+    """
+    docs = nlp.pipe(
+        texts,
+        batch_size=batch_size,
+        n_process=n_process)
 
-    tokens = [
-        token.lemma_
-        for token in doc
-        if (
-            not token.is_stop
-            and not token.is_punct
-            and not token.is_space
-            and token.pos_ in {"NOUN", "PROPN", "ADJ"}
-        )
-    ]
+    tokens = []
+    for doc in docs:
+        tokens.extend(doc_lemmas(doc))
 
     cleaned_text = " ".join(tokens)
 
     return cleaned_text
 
 
-def remove_parentheses(text):
+def doc_lemmas(doc):
     """
-    Remove all text in parentheses (including parentheses).
-    Also removes any leading/trailing whitespace that may remain.
+    Lemmas of nouns, proper nouns and adjectives in a processed doc,
+    skipping stopwords and punctuation.
     """
-    cleaned = re.sub(r'\([^)]*\)', '', text)
-    # Remove extra spaces that may result from removal
-    cleaned = re.sub(r'\s+', ' ', cleaned)
-    return cleaned.strip()
+    # Filter on token attribute arrays instead of looping over Token objects
+    arr = doc.to_array([POS, IS_STOP, IS_PUNCT, IS_SPACE, LEMMA])
+    mask = (
+        np.isin(arr[:, 0], _KEEP_POS)
+        & (arr[:, 1] == 0)
+        & (arr[:, 2] == 0)
+        & (arr[:, 3] == 0)
+    )
+    return [doc.vocab.strings[lemma] for lemma in arr[mask, 4].tolist()]
+
+# %%
+# Process every statement once with the full model and cache docs on disk
+def load_docs(lf, unique_ids, batch_size=64, n_process=1):
+    """
+    Return processed docs of the given statements keyed by unique_id.
+    Docs are read from the cache while the source data is unchanged,
+    otherwise all rows are collected and processed and the cache is rebuilt.
+    """
+    docs_file = CACHE_DIR / "docs.spacy"
+    key_file = CACHE_DIR / "docs.key"
+    data_key = source_key(DATA_PATH)
+
+    if docs_file.exists() and key_file.exists() and key_file.read_text() == data_key:
+        doc_bin = DocBin().from_disk(docs_file)
+    else:
+        rows = lf.drop_nulls("content_clean_v1").collect(engine="streaming")
+        texts = zip(rows["content_clean_v1"], rows["unique_id"])
+
+        # Lexical flags (stopword, punctuation) are restored from the vocab
+        doc_bin = DocBin(attrs=["LEMMA", "POS"], store_user_data=True)
+        for doc, unique_id in nlp.pipe(
+                texts, as_tuples=True, batch_size=batch_size, n_process=n_process):
+            doc.user_data["unique_id"] = unique_id
+            doc_bin.add(doc)
+
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        doc_bin.to_disk(docs_file)
+        key_file.write_text(data_key)
+
+    # Only the wanted docs are kept, the rest are dropped while iterating
+    unique_ids = set(unique_ids)
+    return {
+        doc.user_data["unique_id"]: doc
+        for doc in doc_bin.get_docs(nlp.vocab)
+        if doc.user_data["unique_id"] in unique_ids
+    }
+
+# %%
+# Fast processing for wordclouds: tokenizer only, no statistical components.
+# Polish lemmatizer only ships POS-keyed lookup tables, so without the
+# tagger words are counted in their lowercase form instead of the lemma.
+nlp_fast = spacy.blank("pl")
+
+
+def process_texts_fast(texts, batch_size=256):
+    """
+    Quick text processing without lemmatization and POS filtering.
+    Keep words of at least 4 letters which are not stopwords.
+    """
+    docs = nlp_fast.pipe(texts, batch_size=batch_size)
+
+    tokens = []
+    for doc in docs:
+        tokens.extend(
+            token.text
+            for token in doc
+            if not token.is_stop and _WORD_RE.fullmatch(token.text)
+        )
+
+    return " ".join(tokens)
 
 # %%
 # Generate a word cloud from text
 
 
-def generate_word_cloud(text):
+def generate_word_cloud(text, output_file=None, interactive=True):
     """
-    Generate a word cloud from text
+    Generate a word cloud from processed text.
+    Words are counted directly instead of being tokenized again by wordcloud.
+    Image is saved to output_file if given, matplotlib is only used to display it.
     """
     wordcloud = WordCloud(
         width=2000,
         height=1000,
-        background_color='black').generate(str(text))
+        background_color='black').generate_from_frequencies(Counter(str(text).split()))
+
+    if output_file is not None:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        wordcloud.to_file(output_file)
+
+    if not interactive:
+        return
+
     fig = plt.figure(
         figsize=(40, 30),
         facecolor='k',
@@ -100,11 +222,26 @@ def generate_word_cloud(text):
 # %%
 # Aggregate all statements from a speaker and generate a wordcloud
 selected_speaker = "Jarosław Kaczyński"
-
-speaker_rows = dfn[dfn["speaker_name"] == selected_speaker]
-all_text = " ".join(speaker_rows["content_text"].dropna().values)
-cleaned_text_all = process_text(all_text)
+# Lemmatize and filter by POS with the full model, slower
+use_pos_filter = False
+
+speaker_rows = (
+    lf.filter(pl.col("speaker_name") == selected_speaker)
+    .collect(engine="streaming")
+)
+# Statements are processed one by one and only their tokens are joined
+if use_pos_filter:
+    docs = load_docs(lf, speaker_rows["unique_id"], n_process=-1)
+    cleaned_text_all = " ".join(
+        lemma
+        for unique_id in speaker_rows["unique_id"]
+        if unique_id in docs
+        for lemma in doc_lemmas(docs[unique_id])
+    )
+else:
+    cleaned_text_all = process_texts_fast(
+        speaker_rows["content_clean_v1"].drop_nulls())
 print(speaker_rows)
-generate_word_cloud(cleaned_text_all)
+generate_word_cloud(cleaned_text_all, OUTPUT_DIR / f"{selected_speaker}.png")
 
 # %%
@@ -1,44 +1,114 @@
-from typing import List, Dict
+import asyncio
+import logging
+from typing import List, Dict, Optional, Any, Callable, Awaitable
 
-import requests
+import aiohttp
+import orjson
+from aiolimiter import AsyncLimiter
+
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    """Parse a JSON response body with orjson"""
+    return orjson.loads(await response.read())
 
 
 class SejmAPIClient:
-    """Client for interacting with the Sejm API"""
+    """Asynchronous client for interacting with the Sejm API
+
+    A single ``aiohttp.ClientSession`` (and its keep-alive connection pool)
+    is shared by all requests. The session is created lazily inside the
+    running event loop and must be released with ``close()`` or by using
+    the client as an async context manager.
+    """
+
+    def __init__(self, config: Optional[Config] = None):
+        self.config = config or Config()
+        self.base_url = self.config.api_base_url
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._limiter: Optional[AsyncLimiter] = None
+
+    async def __aenter__(self) -> 'SejmAPIClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session on first use within the running event loop"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                headers={
+                    'Accept': 'application/json',
+                    'User-Agent': 'Sejm-Analysis-Tool/1.0'
+                },
+                timeout=aiohttp.ClientTimeout(total=self.config.api_timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=self.config.api_max_concurrency)
+            )
+            self._semaphore = asyncio.Semaphore(
+                self.config.api_max_concurrency)
+            # Token bucket shared by all requests to respect API rate limits
+            self._limiter = AsyncLimiter(
+                self.config.api_max_requests_per_second, 1)
+        return self.session
+
+    async def close(self) -> None:
+        """Close the HTTP session and its connection pool"""
+        if self.session is not None:
+            await self.session.close()
+        self.session = None
+        self._semaphore = None
+        self._limiter = None
+
+    async def _get(self, url: str, read: Callable[[aiohttp.ClientResponse], Awaitable[Any]],
+                   headers: Optional[Dict[str, str]] = None) -> Any:
+        """GET a URL and read the response, retrying transient failures"""
+        session = self._get_session()
+        retries = self.config.api_retry_attempts
+
+        for attempt in range(retries + 1):
+            try:
+                async with self._semaphore, self._limiter:
+                    async with session.get(url, headers=headers) as response:
+                        response.raise_for_status()
+                        return await read(response)
+
+            except aiohttp.ClientResponseError as e:
+                # Client errors (other than rate limiting) will not go away on retry
+                if attempt == retries or (e.status < 500 and e.status != 429):
+                    raise
+                logger.warning(
+                    f"Request to {url} failed with status {e.status}, retrying ({attempt + 1}/{retries})")
 
-    BASE_URL = "https://api.sejm.gov.pl"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == retries:
+                    raise
+                logger.warning(
+                    f"Request to {url} failed: {e!r}, retrying ({attempt + 1}/{retries})")
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Accept': 'application/json',
-            'User-Agent': 'Sejm-Analysis-Tool/1.0'
-        })
+            await asyncio.sleep(2 ** attempt)
 
-    def get_mps(self, term: int = 10) -> List[Dict]:
+    async def get_mps(self, term: int = 10) -> List[Dict]:
         """Get all MPs for a given term"""
-        url = f"{self.BASE_URL}/sejm/term{term}/MP"
-        response = self.session.get(url)
-        response.raise_for_status()
-        return response.json()
+        url = f"{self.base_url}/sejm/term{term}/MP"
+        return await self._get(url, _read_json)
 
-    def get_proceedings(self, term: int = 10) -> List[Dict]:
+    async def get_proceedings(self, term: int = 10) -> List[Dict]:
         """Get list of parliamentary proceedings"""
-        url = f"{self.BASE_URL}/sejm/term{term}/proceedings"
-        response = self.session.get(url)
-        response.raise_for_status()
-        return response.json()
+        url = f"{self.base_url}/sejm/term{term}/proceedings"
+        return await self._get(url, _read_json)
 
-    def get_statement_list(self, term: int, proceeding_num: int, date: str) -> Dict:
+    async def get_statement_list(self, term: int, proceeding_num: int, date: str) -> Dict:
         """Get list of statements for a specific proceeding day"""
-        url = f"{self.BASE_URL}/sejm/term{term}/proceedings/{proceeding_num}/{date}/transcripts"
-        response = self.session.get(url)
-        response.raise_for_status()
-        return response.json()
+        url = f"{self.base_url}/sejm/term{term}/proceedings/{proceeding_num}/{date}/transcripts"
+        return await self._get(url, _read_json)
 
-    def get_statement_transcript(self, term: int, proceeding_num: int, date: str, statement_num: int) -> str:
+    async def get_statement_transcript(self, term: int, proceeding_num: int, date: str, statement_num: int) -> str:
         """Get content of a specific statement in HTML format"""
-        url = f"{self.BASE_URL}/sejm/term{term}/proceedings/{proceeding_num}/{date}/transcripts/{statement_num}"
-        response = self.session.get(url, headers={'Accept': 'text/html'})
-        response.raise_for_status()
-        return response.text
+        url = f"{self.base_url}/sejm/term{term}/proceedings/{proceeding_num}/{date}/transcripts/{statement_num}"
+        return await self._get(url, lambda response: response.text(), headers={'Accept': 'text/html'})
@@ -1,10 +1,15 @@
+import asyncio
+import html
 import json
-import time
-from typing import Dict, Optional, Any
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
+from src.analysis.preprocessing import clean_text
 from src.config import Config
 from src.models import MP, Statement
 from src.client import SejmAPIClient
@@ -12,23 +17,101 @@ from src.storage import StorageBackend, JSONStorage, CSVStorage
 
 logger = logging.getLogger(__name__)
 
+# Documents where every paragraph is either a bare <p> with plain text or a <p class="...">
+# can be read without a parser. Anything else (other attributes, inline or block tags,
+# stray "<", raw text elements, comments) goes to the parser.
+_PLAIN_P_RE = re.compile(r'<p>([^<]*)</p>', re.IGNORECASE)
+_P_OPEN_RE = re.compile(r'<p[\s/>]', re.IGNORECASE)
+_CLASSED_P_RE = re.compile(
+    r'<p\s+class\s*=\s*(?:"[^"<>]+"|\'[^\'<>]+\')\s*>', re.IGNORECASE)
+_RAW_TEXT_RE = re.compile(
+    r'<(?:script|style|textarea|title|xmp|iframe|noembed|noframes|noscript|plaintext|template)\b'
+    r'|<!--|<!\[CDATA\[', re.IGNORECASE)
+
+
+def _extract_plain_paragraphs(html_content: str) -> Optional[List[str]]:
+    """Extract unclassed paragraphs with regular expressions.
+    Returns None when the markup is not simple enough to be handled this way."""
+    if _RAW_TEXT_RE.search(html_content):
+        return None
+
+    paragraphs = _PLAIN_P_RE.findall(html_content)
+    classed = len(_CLASSED_P_RE.findall(html_content))
+    if not paragraphs or len(paragraphs) + classed != len(_P_OPEN_RE.findall(html_content)):
+        return None
+
+    content_parts = []
+    for paragraph in paragraphs:
+        # Mirror the parser: decode entities and normalize newlines
+        text = html.unescape(paragraph).replace(
+            '\r\n', '\n').replace('\r', '\n').strip()
+        if text:
+            content_parts.append(text)
+
+    return content_parts
+
+
+def _parse_paragraphs(html_content: str) -> List[str]:
+    """Extract unclassed paragraphs with the HTML parser"""
+    # Empty class attributes count as unclassed
+    tree = LexborHTMLParser(html_content)
+    content_parts = []
+    for p in tree.css('p:not([class]), p[class=""]'):
+        text = p.text().strip()
+        if text:
+            content_parts.append(text)
+
+    return content_parts
+
+
+def _extract_paragraphs(html_content: str) -> List[str]:
+    """Extract stripped text of paragraphs without a class attribute"""
+    content_parts = _extract_plain_paragraphs(html_content)
+    if content_parts is not None:
+        return content_parts
+    return _parse_paragraphs(html_content)
+
+
+def _extract_content(html_content: str) -> Tuple[str, str]:
+    """Extract plain and cleaned text from HTML content.
+    Module-level so it can run in extraction worker processes."""
+    content_text = '\n'.join(_extract_paragraphs(html_content))
+    return content_text, clean_text(content_text)
+
 
 class DataCollector:
 
-    def __init__(self, config: Config, storage: StorageBackend):
+    def __init__(self, config: Config, storage: StorageBackend,
+                 client: Optional[SejmAPIClient] = None):
         self.config = config
-        self.client = SejmAPIClient()
+        self.client = client or SejmAPIClient(config)
         self.storage = storage
         self.processed_statements = self.storage.get_processed_statements()
         self.new_statement_entries = 0
-
-    def collect_mps(self, term: Optional[int] = None) -> None:
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the extraction process pool on first use.
+        Workers are not forked, the storage writer and aiohttp threads are already running."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.config.extraction_workers,
+                mp_context=multiprocessing.get_context("forkserver"))
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the extraction process pool"""
+        if self._executor is not None:
+            self._executor.shutdown()
+        self._executor = None
+
+    async def collect_mps(self, term: Optional[int] = None) -> None:
         """Collect and save all MPs data"""
         term = term or self.config.parliamentary_term
         logger.info(f"Collecting MPs for term {term}")
 
         try:
-            mps_data = self.client.get_mps(term)
+            mps_data = await self.client.get_mps(term)
             logger.info(f"Found {len(mps_data)} MPs")
 
             for mp_data in mps_data:
@@ -45,22 +128,25 @@ class DataCollector:
             logger.error(f"Error collecting MPs: {e}")
             raise
 
-    def collect_statements(self, term: Optional[int] = None,
-                           limit_proceedings: Optional[int] = None, update_existing: Optional[bool] = False) -> None:
+    async def collect_statements(self, term: Optional[int] = None,
+                                 limit_proceedings: Optional[int] = None, update_existing: Optional[bool] = False) -> None:
         """Collect statements data"""
         term = term or self.config.parliamentary_term
         logger.info(f"Collecting statements for term {term}")
 
         try:
-            proceedings = self.client.get_proceedings(term)
+            proceedings = await self.client.get_proceedings(term)
             logger.info(f"Found {len(proceedings)} sittings")
 
-            for i, proceeding in enumerate(proceedings):
-                if limit_proceedings and i >= limit_proceedings:
-                    logger.info(f"Reached sitting limit: {limit_proceedings}")
-                    break
+            if limit_proceedings and len(proceedings) > limit_proceedings:
+                logger.info(f"Reached sitting limit: {limit_proceedings}")
+                proceedings = proceedings[:limit_proceedings]
 
-                self._process_proceeding(term, proceeding, update_existing)
+            # Proceedings are independent, the client bounds requests in flight
+            async with asyncio.TaskGroup() as tg:
+                for proceeding in proceedings:
+                    tg.create_task(self._process_proceeding(
+                        term, proceeding, update_existing))
 
             # Flush remaining statements after completion
             self.storage.flush_all()
@@ -78,34 +164,36 @@ class DataCollector:
             logger.error(f"Error collecting speeches: {e}")
             raise
 
-    def _process_proceeding(self, term: int, proceeding: Dict[str, Any], update_existing: Optional[bool] = False) -> None:
+    async def _process_proceeding(self, term: int, proceeding: Dict[str, Any], update_existing: Optional[bool] = False) -> None:
         """Process a single proceeding"""
         proceeding_num = proceeding['number']
         logger.info(
             f"Processing proceeding {proceeding_num}: {proceeding['title']}")
 
-        for date in proceeding['dates']:
-            self._process_proceeding_date(
-                term, proceeding_num, date, update_existing)
+        async with asyncio.TaskGroup() as tg:
+            for date in proceeding['dates']:
+                tg.create_task(self._process_proceeding_date(
+                    term, proceeding_num, date, update_existing))
 
-    def _process_proceeding_date(self, term: int, proceeding_num: int, date: str, update_existing: Optional[bool] = False):
+    async def _process_proceeding_date(self, term: int, proceeding_num: int, date: str, update_existing: Optional[bool] = False):
         """Process statements for a specific proceeding date"""
         logger.info(
             f"Processing date: {date} of proceeding number {proceeding_num}")
 
         try:
-            statements_data = self.client.get_statement_list(
+            statements_data = await self.client.get_statement_list(
                 term, proceeding_num, date)
-            statements = statements_data.get('statements', [])
-
-            new_statements = 0
-            for statement in statements:
-                if self._should_process_statement(statement, proceeding_num, date, update_existing):
-                    if self._process_statement(term, proceeding_num, date, statement):
-                        new_statements += 1
-
-                    # Respect API rate limits
-                    time.sleep(self.config.api_delay_between_requests)
+            statements = [
+                statement for statement in statements_data.get('statements', [])
+                if self._should_process_statement(statement, proceeding_num, date, update_existing)
+            ]
+
+            # Fetch transcripts concurrently, the client bounds requests in flight
+            results = await asyncio.gather(*(
+                self._process_statement(term, proceeding_num, date, statement)
+                for statement in statements
+            ))
+            new_statements = sum(results)
 
             logger.info(f"    Processed {new_statements} statements")
 
@@ -138,17 +226,22 @@ class DataCollector:
         """Generate unique identifier for the speech"""
         return f"{term}_{proceeding_num}_{proceeding_date}_{statement_num}"
 
-    def _process_statement(self, term: int, proceeding_num: int,
-                           date: str, statement: Dict[str, Any]) -> bool:
+    async def _process_statement(self, term: int, proceeding_num: int,
+                                 date: str, statement: Dict[str, Any]) -> bool:
         """Process a single statement"""
         try:
             # Fetch content
-            content_html = self.client.get_statement_transcript(
+            content_html = await self.client.get_statement_transcript(
                 term, proceeding_num, date, statement['num']
             )
 
-            # Extract text content
-            content_text = self._extract_text_content(content_html)
+            # Extract text content, in worker processes when configured
+            if self.config.extraction_workers > 0:
+                loop = asyncio.get_running_loop()
+                content_text, content_clean = await loop.run_in_executor(
+                    self._get_executor(), _extract_content, content_html)
+            else:
+                content_text, content_clean = _extract_content(content_html)
 
             # Create statement object
             statement_obj = Statement(
@@ -163,6 +256,7 @@ class DataCollector:
                 start_time=statement.get('startDateTime'),
                 end_time=statement.get('endDateTime'),
                 content_text=content_text,
+                content_clean_v1=content_clean,
                 content_html=content_html,
                 is_unspoken=statement.get('unspoken', False)
             )
@@ -178,14 +272,3 @@ class DataCollector:
             logger.error(
                 f"      Error processing statement {statement['num']}: {e}")
             return False
-
-    def _extract_text_content(self, html_content: str) -> str:
-        """Extract plain text from HTML content"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        content_parts = []
-        for p in soup.find_all('p'):
-            if not p.get('class') and p.text.strip():
-                content_parts.append(p.text.strip())
-
-        return '\n'.join(content_parts)
@@ -11,14 +11,16 @@ class Config:
     api_base_url: str = "https://api.sejm.gov.pl"
     api_timeout: int = 30
     api_retry_attempts: int = 3
-    api_delay_between_requests: float = 0
+    api_max_requests_per_second: float = 10
+    api_max_concurrency: int = 8
 
     # Data collection settings
     parliamentary_term: int = 10
     batch_size: int = 100
+    extraction_workers: int = 0  # 0 extracts transcript text inline
 
     # Storage settings
-    storage_type: str = 'csv'
+    storage_type: str = 'parquet'
     data_dir: Path = Path("data")
     database_path: Path = Path("data/sejm.db")
     raw_data_dir: Path = Path("data/raw")
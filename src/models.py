@@ -58,11 +58,16 @@ class Statement:
     start_time: Optional[str] = None
     end_time: Optional[str] = None
     content_text: str = ""
+    content_clean_v1: str = ""
     content_html: str = ""
     is_unspoken: bool = False
 
-    def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+    def to_dict(self, include_html: bool = False) -> Dict[str, Any]:
+        """Serialize the statement, raw HTML is left out unless requested"""
+        data = asdict(self)
+        if not include_html:
+            del data['content_html']
+        return data
 
     @property
     def unique_id(self) -> str:
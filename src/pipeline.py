@@ -1,9 +1,11 @@
 """Main data pipeline orchestrator"""
+import asyncio
 import logging
 from typing import Optional
 
 from src.config import Config
-from src.storage import StorageBackend, JSONStorage, CSVStorage
+from src.storage import StorageBackend, JSONStorage, CSVStorage, ParquetStorage, SQLiteStorage
+from src.client import SejmAPIClient
 from src.collector import DataCollector
 
 logger = logging.getLogger(__name__)
@@ -19,8 +21,11 @@ class SejmDataPipeline:
         # Initialize storage backend based on type
         self.storage = self._init_storage(storage_type)
 
+        # A single API client shares its connection pool across all collection steps
+        self.client = SejmAPIClient(self.config)
+
         # Initialize collector
-        self.collector = DataCollector(self.config, self.storage)
+        self.collector = DataCollector(self.config, self.storage, self.client)
 
     def _setup_logging(self):
         """Setup logging configuration"""
@@ -40,18 +45,40 @@ class SejmDataPipeline:
         elif storage_type == "csv":
             logger.info("Using CSV storage backend")
             return CSVStorage(self.config.data_dir, self.config.batch_size)
+        elif storage_type == "parquet":
+            logger.info("Using Parquet storage backend")
+            return ParquetStorage(self.config.data_dir, self.config.batch_size)
+        elif storage_type == "sqlite":
+            logger.info("Using SQLite storage backend")
+            return SQLiteStorage(self.config.database_path, self.config.batch_size)
 
     def run_full_collection(self, limit_proceedings: Optional[int] = None):
         """Run full data collection pipeline"""
+        try:
+            asyncio.run(self._run_full_collection(limit_proceedings))
+        finally:
+            self.collector.close()
+            self.storage.close()
+
+    def run_incremental_update(self, limit_proceedings: Optional[int] = None):
+        """Run incremental update (only new data)"""
+        try:
+            asyncio.run(self._run_incremental_update(limit_proceedings))
+        finally:
+            self.collector.close()
+            self.storage.close()
+
+    async def _run_full_collection(self, limit_proceedings: Optional[int] = None):
         logger.info("Starting full data collection")
 
         try:
-            # Collect MPs
-            self.collector.collect_mps()
+            async with self.client:
+                # Collect MPs
+                await self.collector.collect_mps()
 
-            # Collect speeches
-            self.collector.collect_statements(
-                limit_proceedings=limit_proceedings, update_existing=True)
+                # Collect speeches
+                await self.collector.collect_statements(
+                    limit_proceedings=limit_proceedings, update_existing=True)
 
             logger.info("Data collection completed successfully")
 
@@ -59,16 +86,16 @@ class SejmDataPipeline:
             logger.error(f"Pipeline failed: {e}")
             raise
 
-    def run_incremental_update(self, limit_proceedings: Optional[int] = None):
-        """Run incremental update (only new data)"""
+    async def _run_incremental_update(self, limit_proceedings: Optional[int] = None):
         logger.info("Starting incremental update")
 
-        # Collect MPs
-        self.collector.collect_mps()
+        async with self.client:
+            # Collect MPs
+            await self.collector.collect_mps()
 
-        # The collector automatically skips already processed speeches
-        # Not implemented properly yet
-        self.collector.collect_statements(
-            limit_proceedings=limit_proceedings, update_existing=False)
+            # The collector automatically skips already processed speeches
+            # Not implemented properly yet
+            await self.collector.collect_statements(
+                limit_proceedings=limit_proceedings, update_existing=False)
 
         logger.info("Incremental update completed")
@@ -1,23 +1,98 @@
 """Storage layer for the Sejm data pipeline"""
-import json
 import csv
+import os
+import queue
+import sqlite3
+import threading
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, NamedTuple, Optional, Dict, Any
 from abc import ABC, abstractmethod
+from collections import Counter
 from datetime import datetime
 import logging
 
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from src.models import MP, Statement
 from src.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Writer thread commands: flush buffered rows to disk, optionally closing the file
+_SYNC = object()
+_CLOSE = object()
+
+MP_COLUMNS = [
+    'id', 'term', 'first_name', 'last_name', 'club',
+    'district_name', 'district_num', 'voivodeship',
+    'profession', 'education_level', 'email', 'photo_url', 'active'
+]
+
+STATEMENTS_SCHEMA = pa.schema([
+    ('unique_id', pa.string()),
+    ('term', pa.int16()),
+    ('proceeding_num', pa.int16()),
+    ('proceeding_date', pa.string()),
+    ('statement_num', pa.int32()),
+    ('speaker_mp_id', pa.int32()),
+    ('speaker_name', pa.string()),
+    ('speaker_function', pa.string()),
+    ('start_time', pa.string()),
+    ('end_time', pa.string()),
+    ('content_text', pa.string()),
+    ('content_clean_v1', pa.string()),
+    ('is_unspoken', pa.bool_()),
+    ('collected_at', pa.string())
+])
+
+
+class StatementRow(NamedTuple):
+    """Fixed-layout statement row, fields follow STATEMENTS_SCHEMA"""
+    unique_id: str
+    term: int
+    proceeding_num: int
+    proceeding_date: str
+    statement_num: int
+    speaker_mp_id: Optional[int]
+    speaker_name: str
+    speaker_function: str
+    start_time: str
+    end_time: str
+    content_text: str
+    content_clean_v1: str
+    is_unspoken: bool
+    collected_at: str
+
+
+def _statement_record(statement: Statement, collected_at: str) -> StatementRow:
+    """Flatten a statement into a storage row"""
+    return StatementRow(
+        statement.unique_id,
+        statement.term,
+        statement.proceeding_num,
+        statement.proceeding_date,
+        statement.statement_num,
+        statement.speaker_mp_id,
+        statement.speaker_name,
+        statement.speaker_function,
+        statement.start_time,
+        statement.end_time,
+        statement.content_text,
+        statement.content_clean_v1,
+        statement.is_unspoken,
+        collected_at
+    )
+
 
 class StorageBackend(ABC):
     """Abstract base class for storage backends"""
 
+    # Timestamp of the pending statement batch, see _batch_collected_at
+    _collected_at: Optional[str] = None
+
     @abstractmethod
     def save_mp(self, mp: MP) -> None:
         """Save MP data"""
@@ -33,6 +108,17 @@ class StorageBackend(ABC):
         """Get set of already processed statements IDs"""
         pass
 
+    def close(self) -> None:
+        """Release open files, the backend can still be used afterwards"""
+        pass
+
+    def _batch_collected_at(self, pending: list) -> str:
+        """Collection timestamp shared by all rows of a pending batch,
+        taken when the first row is added"""
+        if not pending or self._collected_at is None:
+            self._collected_at = datetime.now().isoformat()
+        return self._collected_at
+
 
 class CSVStorage(StorageBackend):
     """CSV file storage backend"""
@@ -42,63 +128,171 @@ class CSVStorage(StorageBackend):
         self.mps_file = data_dir / "mps.csv"
         self.statements_file = data_dir / "statements.csv"
         self.processed_file = data_dir / "processed_statements.txt"
+        self.statistics_file = data_dir / "statements_statistics.json"
         self.batch_size = batch_size
 
-        # Load existing data into memory for better performance
+        # Load existing data into memory for better performance.
+        # Statements are only appended to the file, IDs and statistics are kept in sidecar files
         self.mps_df = self._load_mps_df()
-        self.statements_df = self._load_statements_df()
+        self._migrate_statements_header()
+        self.processed_statements = self._load_processed_statements()
+        self._mp_club = dict(zip(self.mps_df['id'], self.mps_df['club']))
+        self._init_statistics()
 
         # Batch processing placeholders
         self.pending_mps = []
         self.pending_statements = []
 
+        # Statement batches are written to disk by a background thread
+        # through a long-lived, large-buffered file handle
+        self._write_queue = queue.Queue()
+        self._write_error: Optional[Exception] = None
+        self._statements_fh = None
+        self._statements_writer = None
+        self._statements_layout: Optional[List[Optional[int]]] = None
+        self._unsynced_ids: List[str] = []
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+
     def _load_mps_df(self) -> pd.DataFrame:
         """Load existing MPs data or create empty DataFrame"""
         if self.mps_file.exists():
             return pd.read_csv(self.mps_file, encoding='utf-8')
         else:
-            return pd.DataFrame(columns=[
-                'id', 'term', 'first_name', 'last_name', 'club',
-                'district_name', 'district_num', 'voivodeship',
-                'profession', 'education_level', 'email', 'photo_url', 'active'
-            ])
-
-    def _load_statements_df(self) -> pd.DataFrame:
-        """Load existing speeches data or create empty DataFrame"""
-        if self.statements_file.exists():
-
-            dtypes = {
-                'unique_id': str,
-                'term': 'int16',
-                'proceeding_num': 'int16',
-                'proceeding_date': str,
-                'statement_num': 'int32',
-                'speaker_name': str,
-                'speaker_mp_id': 'Int32',
-                'speaker_function': str,
-                'start_time': str,
-                'end_time': str,
-                'content_text': str,
-                'is_unspoken': bool,
-                'collected_at': str
-            }
-            return pd.read_csv(self.statements_file, encoding='utf-8', dtype=dtypes)
-        else:
-            return pd.DataFrame(columns=[
-                'unique_id',
-                'term',
-                'proceeding_num',
-                'proceeding_date',
-                'statement_num',
-                'speaker_name',
-                'speaker_mp_id',
-                'speaker_function',
-                'start_time',
-                'end_time',
-                'content_text',
-                'is_unspoken',
-                'collected_at'
-            ])
+            return pd.DataFrame(columns=MP_COLUMNS)
+
+    def _migrate_statements_header(self) -> None:
+        """Rewrite a statements CSV created by an older version with the current columns.
+        Columns missing from the file are left empty, columns unknown to this version
+        are kept after the current ones."""
+        if not self.statements_file.exists():
+            return
+
+        fields = list(StatementRow._fields)
+        with open(self.statements_file, 'r', newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f), None)
+        if header is None:
+            # Nothing was ever written, the file gets a fresh header on first write
+            self.statements_file.unlink()
+            return
+        if header[:len(fields)] == fields:
+            return
+
+        new_header = fields + [field for field in header if field not in fields]
+        positions = {field: i for i, field in enumerate(header)}
+        layout = [positions.get(field) for field in new_header]
+
+        logger.info(
+            f"Migrating {self.statements_file.name} to columns: {', '.join(new_header)}")
+        tmp_file = self.statements_file.with_name(self.statements_file.name + '.tmp')
+        with open(self.statements_file, 'r', newline='', encoding='utf-8') as f_in, \
+                open(tmp_file, 'w', newline='', encoding='utf-8') as f_out:
+            reader = csv.reader(f_in)
+            next(reader)
+            writer = csv.writer(f_out, lineterminator='\n')
+            writer.writerow(new_header)
+            writer.writerows(
+                [row[i] if i is not None and i < len(row) else '' for i in layout]
+                for row in reader)
+        os.replace(tmp_file, self.statements_file)
+
+    def _is_fresh(self, path: Path) -> bool:
+        """Whether a sidecar file was written after the last change to the statements CSV"""
+        return path.exists() and \
+            path.stat().st_mtime_ns >= self.statements_file.stat().st_mtime_ns
+
+    def _init_statistics(self) -> None:
+        """Load statement statistics counters from their sidecar file.
+        They are rebuilt from the statements CSV when the sidecar is missing or older than the CSV.
+        The rebuild converts only the needed columns, but still tokenizes the whole file."""
+        self._statements_total = 0
+        self._unique_speakers = set()
+        self._date_min = None
+        self._date_max = None
+        self._statements_by_mp = Counter()
+        if not self.statements_file.exists():
+            self.statistics_file.unlink(missing_ok=True)
+            return
+
+        if self._is_fresh(self.statistics_file):
+            statistics = orjson.loads(self.statistics_file.read_bytes())
+            self._statements_total = statistics['total_statements']
+            self._unique_speakers = set(statistics['unique_speakers'])
+            self._date_min = statistics['date_min']
+            self._date_max = statistics['date_max']
+            self._statements_by_mp = Counter(dict(statistics['statements_by_mp']))
+            return
+
+        logger.info(
+            f"Building {self.statistics_file.name} from {self.statements_file.name}")
+        dtypes = {
+            'proceeding_date': str,
+            'speaker_name': str,
+            'speaker_mp_id': 'Int32'
+        }
+        for chunk in pd.read_csv(self.statements_file, encoding='utf-8', usecols=list(dtypes),
+                                 dtype=dtypes, chunksize=100_000):
+            self._statements_total += len(chunk)
+            self._unique_speakers.update(chunk['speaker_name'].dropna())
+            dates = chunk['proceeding_date'].dropna()
+            if not dates.empty:
+                self._date_min = min(filter(None, [self._date_min, dates.min()]))
+                self._date_max = max(filter(None, [self._date_max, dates.max()]))
+            self._statements_by_mp.update(
+                chunk['speaker_mp_id'].dropna().astype(int).tolist())
+        self._save_statistics()
+
+    def _save_statistics(self) -> None:
+        """Write statement statistics counters to their sidecar file"""
+        tmp_file = self.statistics_file.with_name(self.statistics_file.name + '.tmp')
+        tmp_file.write_bytes(orjson.dumps({
+            'total_statements': self._statements_total,
+            'unique_speakers': sorted(self._unique_speakers),
+            'date_min': self._date_min,
+            'date_max': self._date_max,
+            'statements_by_mp': list(self._statements_by_mp.items())
+        }))
+        os.replace(tmp_file, self.statistics_file)
+
+    def _update_statistics(self, rows: List[StatementRow]) -> None:
+        """Count written statement rows in the statistics"""
+        for row in rows:
+            self._statements_total += 1
+            self._unique_speakers.add(row.speaker_name)
+            date = row.proceeding_date
+            if self._date_min is None or date < self._date_min:
+                self._date_min = date
+            if self._date_max is None or date > self._date_max:
+                self._date_max = date
+            if row.speaker_mp_id is not None:
+                self._statements_by_mp[row.speaker_mp_id] += 1
+
+    def _load_processed_statements(self) -> set:
+        """Load processed statement IDs from the sidecar file.
+        The sidecar is rebuilt from the statements CSV when it is missing or older than the CSV,
+        e.g. when buffered rows reached the CSV but a crash kept their IDs from being recorded."""
+        if not self.statements_file.exists():
+            # IDs of a deleted statements file must not cause skipped statements
+            self.processed_file.unlink(missing_ok=True)
+            return set()
+
+        if self._is_fresh(self.processed_file):
+            with open(self.processed_file, 'r', encoding='utf-8') as f:
+                return {line.rstrip('\n') for line in f if line.strip()}
+
+        logger.info(
+            f"Building {self.processed_file.name} from {self.statements_file.name}")
+        unique_ids = pd.read_csv(
+            self.statements_file, encoding='utf-8', usecols=['unique_id'], dtype=str
+        )['unique_id'].unique()
+        self.processed_file.unlink(missing_ok=True)
+        self._append_processed(unique_ids)
+        return set(unique_ids)
+
+    def _append_processed(self, unique_ids) -> None:
+        """Append statement IDs to the sidecar file"""
+        with open(self.processed_file, 'a', encoding='utf-8') as f:
+            f.writelines(f"{unique_id}\n" for unique_id in unique_ids)
 
     def save_mp(self, mp: MP) -> None:
         """Add MP to pending batch"""
@@ -125,7 +319,7 @@ class CSVStorage(StorageBackend):
     def save_statement(self, statement: Statement) -> None:
         """Add speech to pending batch"""
         # Skip if already processed
-        if statement.unique_id in self.get_processed_statements():
+        if statement.unique_id in self.processed_statements:
             logger.debug(
                 f"Statement with id: {statement.unique_id} already exists. Skipping saving...")
             return
@@ -133,21 +327,10 @@ class CSVStorage(StorageBackend):
         logger.debug(
             f"Adding statement with id: {statement.unique_id} to batch")
 
-        self.pending_statements.append({
-            'unique_id': statement.unique_id,
-            'term': statement.term,
-            'proceeding_num': statement.proceeding_num,
-            'proceeding_date': statement.proceeding_date,
-            'statement_num': statement.statement_num,
-            'speaker_mp_id': statement.speaker_mp_id,
-            'speaker_name': statement.speaker_name,
-            'speaker_function': statement.speaker_function,
-            'start_time': statement.start_time,
-            'end_time': statement.end_time,
-            'content_text': statement.content_text,
-            'is_unspoken': statement.is_unspoken,
-            'collected_at': datetime.now().isoformat()
-        })
+        self.pending_statements.append(
+            _statement_record(statement, self._batch_collected_at(self.pending_statements)))
+        # Also catches duplicates within the pending batch
+        self.processed_statements.add(statement.unique_id)
 
         # Flush if batch is full
         if len(self.pending_statements) >= self.batch_size:
@@ -161,22 +344,28 @@ class CSVStorage(StorageBackend):
         new_mps_df = pd.DataFrame(self.pending_mps)
 
         # Remove duplicates based on id and term
-        existing_keys = set(zip(self.mps_df['id'], self.mps_df['term']))
-        new_mps_df = new_mps_df[
-            ~new_mps_df.apply(lambda x: (
-                x['id'], x['term']) in existing_keys, axis=1)
-        ]
+        existing_keys = pd.MultiIndex.from_frame(self.mps_df[['id', 'term']])
+        new_keys = pd.MultiIndex.from_frame(new_mps_df[['id', 'term']])
+        is_new = ~new_keys.isin(existing_keys)
 
-        if not new_mps_df.empty:
+        if is_new.any():
             # Append to in-memory DataFrame
             self.mps_df = pd.concat(
-                [self.mps_df, new_mps_df], ignore_index=True)
-
-            # Save to CSV
-            self.mps_df.to_csv(self.mps_file, index=False, encoding='utf-8')
-            logger.info(f"Saved {len(new_mps_df)} new MPs to CSV")
-
-        logger.info(f"MPs already exist in the CSV. Skipping.")
+                [self.mps_df, new_mps_df[is_new]], ignore_index=True)
+
+            # Append only the new rows to CSV, straight from the pending dicts
+            new_rows = [row for row, new in zip(self.pending_mps, is_new) if new]
+            self._mp_club.update((row['id'], row['club']) for row in new_rows)
+            write_header = not self.mps_file.exists()
+            with open(self.mps_file, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(
+                    f, fieldnames=MP_COLUMNS, lineterminator='\n')
+                if write_header:
+                    writer.writeheader()
+                writer.writerows(new_rows)
+            logger.info(f"Saved {len(new_rows)} new MPs to CSV")
+        else:
+            logger.info(f"MPs already exist in the CSV. Skipping.")
 
         self.pending_mps = []
 
@@ -185,52 +374,269 @@ class CSVStorage(StorageBackend):
         if not self.pending_statements:
             return
 
-        new_statements_df = pd.DataFrame(self.pending_statements)
-
-        # Append to in-memory DataFrame
-        self.statements_df = pd.concat(
-            [self.statements_df, new_statements_df], ignore_index=True)
+        batch = self.pending_statements
+        self.pending_statements = []
 
-        # Save to CSV
-        if self.statements_file.exists():
-            new_statements_df.to_csv(
-                self.statements_file,
-                mode='a',
-                header=False,
-                index=False,
-                encoding='utf-8'
-            )
+        # Hand the batch over to the writer thread
+        self._write_queue.put(batch)
+
+    def _writer_loop(self) -> None:
+        """Write queued statement batches to CSV"""
+        while True:
+            item = self._write_queue.get()
+            try:
+                if item is _SYNC:
+                    self._sync_statements()
+                elif item is _CLOSE:
+                    self._sync_statements()
+                    self._close_statements_file()
+                else:
+                    self._write_statements(item)
+            except Exception as e:
+                logger.error(f"Error writing statements to CSV: {e}")
+                self._write_error = e
+            finally:
+                self._write_queue.task_done()
+
+    def _open_statements_file(self):
+        """Open the statements CSV for appending"""
+        write_header = not self.statements_file.exists()
+        fieldnames = list(StatementRow._fields)
+        if not write_header:
+            # Files are migrated on start-up, extra columns kept from older versions stay empty
+            with open(self.statements_file, 'r', newline='', encoding='utf-8') as f:
+                fieldnames = next(csv.reader(f), fieldnames)
+
+        # Map file columns to row positions, rows are written as-is when they match
+        if fieldnames != list(StatementRow._fields):
+            positions = {field: i for i, field in enumerate(StatementRow._fields)}
+            self._statements_layout = [positions.get(field) for field in fieldnames]
+
+        self._statements_fh = open(
+            self.statements_file, 'a', newline='', encoding='utf-8', buffering=1 << 20)
+        writer = csv.writer(self._statements_fh, lineterminator='\n')
+        if write_header:
+            writer.writerow(fieldnames)
+        return writer
+
+    def _write_statements(self, rows: List[StatementRow]) -> None:
+        """Append statement rows to the buffered CSV file"""
+        if self._statements_writer is None:
+            self._statements_writer = self._open_statements_file()
+
+        if self._statements_layout is None:
+            self._statements_writer.writerows(rows)
         else:
-            new_statements_df.to_csv(
-                self.statements_file,
-                index=False,
-                encoding='utf-8'
-            )
+            layout = self._statements_layout
+            self._statements_writer.writerows(
+                [row[i] if i is not None else '' for i in layout] for row in rows)
+        self._unsynced_ids.extend(row.unique_id for row in rows)
+        self._update_statistics(rows)
+
+        logger.info(f"Saved {len(rows)} new statements to CSV")
+
+    def _sync_statements(self) -> None:
+        """Flush buffered rows to disk, then record their IDs as processed"""
+        if self._statements_fh is not None:
+            self._statements_fh.flush()
+
+        # Record IDs only once their rows are on disk. The sidecar is then newer than
+        # the CSV, rows flushed by a full buffer after this point trigger a rebuild on start-up
+        if self._unsynced_ids:
+            self._append_processed(self._unsynced_ids)
+            self._save_statistics()
+            self._unsynced_ids = []
+
+    def _close_statements_file(self) -> None:
+        if self._statements_fh is not None:
+            self._statements_fh.close()
+        self._statements_fh = None
+        self._statements_writer = None
+        self._statements_layout = None
+
+    def get_processed_statements(self) -> set:
+        """Get set of processed speech IDs"""
+        return self.processed_statements
+
+    def flush_all(self):
+        """Flush all pending data and wait until it is written"""
+        self.flush_mps()
+        self.flush_statements()
+        self._write_queue.put(_SYNC)
+        self._write_queue.join()
+
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise error
+
+    def close(self) -> None:
+        """Write pending data and close the statements file"""
+        self.flush_all()
+        self._write_queue.put(_CLOSE)
+        self._write_queue.join()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get statistics about stored data"""
+        # Counters are updated by the writer thread, wait for queued batches
+        self._write_queue.put(_SYNC)
+        self._write_queue.join()
+
+        # Resolve clubs through the id -> club lookup instead of joining tables
+        statements_by_club = Counter()
+        for mp_id, count in self._statements_by_mp.items():
+            club = self._mp_club.get(mp_id)
+            if isinstance(club, str):
+                statements_by_club[club] += count
+
+        return {
+            'total_mps': len(self.mps_df),
+            'total_statements': self._statements_total,
+            'unique_speakers': len(self._unique_speakers),
+            'date_range': {
+                'from': self._date_min,
+                'to': self._date_max
+            },
+            'statements_by_club': dict(statements_by_club.most_common())
+        }
+
+
+class ParquetStorage(StorageBackend):
+    """Parquet file storage backend.
+    Statements are written as a dataset of zstd-compressed part files, one per flushed batch,
+    partitioned by term and proceeding (statements.parquet/term=10/proceeding_num=1/...)."""
+
+    def __init__(self, data_dir: Path, batch_size: int):
+        self.data_dir = data_dir
+        self.mps_file = data_dir / "mps.parquet"
+        self.statements_dir = data_dir / "statements.parquet"
+        self.statements_dir.mkdir(exist_ok=True)
+        self.batch_size = batch_size
+
+        self.mps_df = self._load_mps_df()
+        self.processed_statements = self._load_processed_statements()
+
+        # Batch processing placeholders
+        self.pending_mps = []
+        self.pending_statements = []
+
+    def _load_mps_df(self) -> pd.DataFrame:
+        """Load existing MPs data or create empty DataFrame"""
+        if self.mps_file.exists():
+            return pd.read_parquet(self.mps_file)
+        return pd.DataFrame(columns=MP_COLUMNS)
+
+    def _has_statements(self) -> bool:
+        return any(self.statements_dir.rglob('*.parquet'))
+
+    def _write_partitioned(self, table: pa.Table) -> None:
+        """Write a table of statements into the partitioned dataset"""
+        pq.write_to_dataset(
+            table,
+            root_path=self.statements_dir,
+            partition_cols=['term', 'proceeding_num'],
+            basename_template=f"part-{datetime.now().strftime('%Y%m%dT%H%M%S%f')}-{{i}}.parquet",
+            compression='zstd'
+        )
+
+    def _load_processed_statements(self) -> set:
+        """Read only the unique_id column of stored statements"""
+        if not self._has_statements():
+            return set()
+        table = pq.read_table(self.statements_dir, columns=['unique_id'])
+        return set(table.column('unique_id').to_pylist())
+
+    def save_mp(self, mp: MP) -> None:
+        """Add MP to pending batch"""
+        self.pending_mps.append(mp.to_dict())
+
+        # Flush if batch is full
+        if len(self.pending_mps) >= self.batch_size:
+            self.flush_mps()
+
+    def save_statement(self, statement: Statement) -> None:
+        """Add statement to pending batch"""
+        if statement.unique_id in self.processed_statements:
+            logger.debug(
+                f"Statement with id: {statement.unique_id} already exists. Skipping saving...")
+            return
+
+        self.pending_statements.append(
+            _statement_record(statement, self._batch_collected_at(self.pending_statements)))
+        self.processed_statements.add(statement.unique_id)
+
+        # Flush if batch is full
+        if len(self.pending_statements) >= self.batch_size:
+            self.flush_statements()
+
+    def flush_mps(self):
+        """Write pending MPs to the Parquet file"""
+        if not self.pending_mps:
+            return
+
+        new_mps_df = pd.DataFrame(self.pending_mps)
+        self.pending_mps = []
+
+        existing_keys = pd.MultiIndex.from_frame(self.mps_df[['id', 'term']])
+        new_keys = pd.MultiIndex.from_frame(new_mps_df[['id', 'term']])
+        new_mps_df = new_mps_df[~new_keys.isin(existing_keys)]
+
+        if new_mps_df.empty:
+            logger.info("MPs already exist in the Parquet file. Skipping.")
+            return
+
+        self.mps_df = pd.concat([self.mps_df, new_mps_df], ignore_index=True)
+        self.mps_df.to_parquet(self.mps_file, index=False, compression='zstd')
+        logger.info(f"Saved {len(new_mps_df)} new MPs to Parquet")
+
+    def flush_statements(self):
+        """Write pending statements as new part files of the partitioned dataset"""
+        if not self.pending_statements:
+            return
 
-        logger.info(f"Saved {len(new_statements_df)} new statements to CSV")
+        columns = zip(*self.pending_statements)
+        table = pa.Table.from_arrays(
+            [pa.array(column, type=field.type)
+             for column, field in zip(columns, STATEMENTS_SCHEMA)],
+            schema=STATEMENTS_SCHEMA)
+        self._write_partitioned(table)
+
+        logger.info(
+            f"Saved {len(self.pending_statements)} new statements to Parquet")
         self.pending_statements = []
 
     def get_processed_statements(self) -> set:
-        """Get set of processed speech IDs from in-memory DataFrame"""
-        return set(self.statements_df['unique_id'].unique())
+        """Get set of processed statements IDs"""
+        return self.processed_statements
 
     def flush_all(self):
         """Flush all pending data"""
         self.flush_mps()
         self.flush_statements()
 
+    def close(self) -> None:
+        """Write pending data, nothing is kept open between batches"""
+        self.flush_all()
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about stored data"""
+        if not self._has_statements():
+            return {'total_mps': len(self.mps_df), 'total_statements': 0}
+
+        statements_df = pq.read_table(
+            self.statements_dir,
+            columns=['speaker_name', 'speaker_mp_id', 'proceeding_date']
+        ).to_pandas()
+
         return {
             'total_mps': len(self.mps_df),
-            'total_statements': len(self.statements_df),
-            'unique_speakers': self.statements_df['speaker_name'].nunique(),
+            'total_statements': len(statements_df),
+            'unique_speakers': statements_df['speaker_name'].nunique(),
             'date_range': {
-                'from': self.statements_df['proceeding_date'].min(),
-                'to': self.statements_df['proceeding_date'].max()
+                'from': statements_df['proceeding_date'].min(),
+                'to': statements_df['proceeding_date'].max()
             },
             'statements_by_club': (
-                self.statements_df
+                statements_df
                 .merge(self.mps_df, left_on='speaker_mp_id', right_on='id')
                 ['club']
                 .value_counts()
@@ -239,9 +645,173 @@ class CSVStorage(StorageBackend):
         }
 
 
+class SQLiteStorage(StorageBackend):
+    """SQLite database storage backend"""
+
+    def __init__(self, database_path: Path, batch_size: int):
+        self.database_path = database_path
+        self.batch_size = batch_size
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._create_tables()
+
+        # Batch processing placeholders
+        self.pending_mps = []
+        self.pending_statements = []
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Database connection, opened on first use and again after close()"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.database_path)
+            # WAL avoids a rollback journal sync on every commit
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA cache_size=-200000")
+        return self._conn
+
+    def _create_tables(self) -> None:
+        """Create tables and indexes if they do not exist"""
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS mps (
+                    id INTEGER NOT NULL,
+                    term INTEGER NOT NULL,
+                    first_name TEXT,
+                    last_name TEXT,
+                    club TEXT,
+                    district_name TEXT,
+                    district_num INTEGER,
+                    voivodeship TEXT,
+                    profession TEXT,
+                    education_level TEXT,
+                    email TEXT,
+                    photo_url TEXT,
+                    active INTEGER,
+                    PRIMARY KEY (id, term)
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS statements (
+                    unique_id TEXT NOT NULL,
+                    term INTEGER,
+                    proceeding_num INTEGER,
+                    proceeding_date TEXT,
+                    statement_num INTEGER,
+                    speaker_mp_id INTEGER,
+                    speaker_name TEXT,
+                    speaker_function TEXT,
+                    start_time TEXT,
+                    end_time TEXT,
+                    content_text TEXT,
+                    content_clean_v1 TEXT,
+                    is_unspoken INTEGER,
+                    collected_at TEXT
+                )
+            """)
+            self.conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_statements_unique_id ON statements(unique_id)")
+
+    def save_mp(self, mp: MP) -> None:
+        """Add MP to pending batch"""
+        self.pending_mps.append(mp.to_dict())
+
+        # Flush if batch is full
+        if len(self.pending_mps) >= self.batch_size:
+            self.flush_mps()
+
+    def save_statement(self, statement: Statement) -> None:
+        """Add statement to pending batch.
+        Duplicates are skipped by the unique index on insert."""
+        self.pending_statements.append(
+            _statement_record(statement, self._batch_collected_at(self.pending_statements)))
+
+        # Flush if batch is full
+        if len(self.pending_statements) >= self.batch_size:
+            self.flush_statements()
+
+    def flush_mps(self):
+        """Insert pending MPs in a single transaction"""
+        if not self.pending_mps:
+            return
+
+        columns = ', '.join(MP_COLUMNS)
+        placeholders = ', '.join(f":{column}" for column in MP_COLUMNS)
+        with self.conn:
+            cursor = self.conn.executemany(
+                f"INSERT OR IGNORE INTO mps ({columns}) VALUES ({placeholders})",
+                self.pending_mps)
+
+        logger.info(f"Saved {cursor.rowcount} new MPs to SQLite")
+        self.pending_mps = []
+
+    def flush_statements(self):
+        """Insert pending statements in a single transaction"""
+        if not self.pending_statements:
+            return
+
+        columns = ', '.join(STATEMENTS_SCHEMA.names)
+        placeholders = ', '.join('?' * len(STATEMENTS_SCHEMA.names))
+        with self.conn:
+            cursor = self.conn.executemany(
+                f"INSERT OR IGNORE INTO statements ({columns}) VALUES ({placeholders})",
+                self.pending_statements)
+
+        logger.info(f"Saved {cursor.rowcount} new statements to SQLite")
+        self.pending_statements = []
+
+    def get_processed_statements(self) -> set:
+        """Get set of processed statements IDs"""
+        return {row[0] for row in self.conn.execute("SELECT unique_id FROM statements")}
+
+    def flush_all(self):
+        """Flush all pending data"""
+        self.flush_mps()
+        self.flush_statements()
+
+    def close(self) -> None:
+        """Write pending data and close the database connection"""
+        self.flush_all()
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get statistics about stored data"""
+        total_mps = self.conn.execute("SELECT COUNT(*) FROM mps").fetchone()[0]
+        total_statements, unique_speakers, date_from, date_to = self.conn.execute("""
+            SELECT COUNT(*), COUNT(DISTINCT speaker_name),
+                   MIN(proceeding_date), MAX(proceeding_date)
+            FROM statements
+        """).fetchone()
+        statements_by_club = dict(self.conn.execute("""
+            SELECT mps.club, COUNT(*)
+            FROM statements
+            JOIN mps ON mps.id = statements.speaker_mp_id AND mps.term = statements.term
+            WHERE mps.club IS NOT NULL
+            GROUP BY mps.club
+            ORDER BY COUNT(*) DESC
+        """))
+
+        return {
+            'total_mps': total_mps,
+            'total_statements': total_statements,
+            'unique_speakers': unique_speakers,
+            'date_range': {
+                'from': date_from,
+                'to': date_to
+            },
+            'statements_by_club': statements_by_club
+        }
+
+
 class JSONStorage(StorageBackend):
     """JSON file storage backend"""
 
+    # Per-date statement files kept open at the same time
+    MAX_OPEN_FILES = 64
+
     def __init__(self, data_dir: Path):
         self.data_dir = data_dir
         self.mps_file = data_dir / "mps.json"
@@ -249,50 +819,106 @@ class JSONStorage(StorageBackend):
         self.statements_dir.mkdir(exist_ok=True)
         self.processed_file = data_dir / "processed_statements.json"
 
-    def save_mp(self, mp: MP) -> None:
-        """Save MP to JSON file"""
-        mps = self._load_mps()
-        mps[f"{mp.term}_{mp.id}"] = mp.to_dict()
+        # Kept in memory and written out on flush
+        self.mps = self._load_mps()
+        self.processed_statements = self._load_processed_statements()
+        self._mps_changed = False
+        self._date_files: Dict[str, Any] = {}
 
-        with open(self.mps_file, 'w', encoding='utf-8') as f:
-            json.dump(mps, f, ensure_ascii=False, indent=2)
+    def save_mp(self, mp: MP) -> None:
+        """Add MP to the in-memory MPs mapping"""
+        self.mps[f"{mp.term}_{mp.id}"] = mp.to_dict()
+        self._mps_changed = True
 
     def save_statement(self, statement: Statement) -> None:
-        """Save statement to JSON file.
-        Creates a file for each proceeding date and dumps individual statement data in it."""
-        date_file = self.statements_dir / f"{statement.proceeding_date}.json"
-
-        statements = {}
-        if date_file.exists():
-            with open(date_file, 'r', encoding='utf-8') as f:
-                statements = json.load(f)
+        """Append statement to a JSON Lines file.
+        Creates a file for each proceeding date with one statement per line."""
+        if statement.unique_id in self.processed_statements:
+            logger.debug(
+                f"Statement with id: {statement.unique_id} already exists. Skipping saving...")
+            return
 
-        statements[statement.unique_id] = statement.to_dict()
+        date_file = self._date_files.get(statement.proceeding_date)
+        if date_file is None:
+            if len(self._date_files) >= self.MAX_OPEN_FILES:
+                # Close the file opened first. Dates are processed concurrently,
+                # a date written again later simply reopens its file in append mode
+                oldest = next(iter(self._date_files))
+                self._date_files.pop(oldest).close()
+            date_file = open(
+                self.statements_dir / f"{statement.proceeding_date}.jsonl", 'ab')
+            self._date_files[statement.proceeding_date] = date_file
 
-        with open(date_file, 'w', encoding='utf-8') as f:
-            json.dump(statements, f, ensure_ascii=False, indent=2)
+        date_file.write(orjson.dumps(statement.to_dict()) + b'\n')
 
-        # Mark as processed
-        self._mark_processed(statement.unique_id)
+        # Mark as processed, persisted on flush
+        self.processed_statements.add(statement.unique_id)
 
     def get_processed_statements(self) -> set:
         """Get set of processed statements IDs"""
+        return self.processed_statements
+
+    def flush_all(self):
+        """Flush statement files, then write MPs and processed statements IDs"""
+        for date_file in self._date_files.values():
+            date_file.flush()
+
+        if self._mps_changed:
+            self.mps_file.write_bytes(
+                orjson.dumps(self.mps, option=orjson.OPT_INDENT_2))
+            self._mps_changed = False
+
+        self.processed_file.write_bytes(
+            orjson.dumps(list(self.processed_statements)))
+
+    def close(self) -> None:
+        """Write pending data and close statement files"""
+        self.flush_all()
+        for date_file in self._date_files.values():
+            date_file.close()
+        self._date_files = {}
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get statistics about stored data.
+        Reads the statement files, only called once at the end of a collection run."""
+        for date_file in self._date_files.values():
+            date_file.flush()
+
+        mp_club = {mp['id']: mp['club'] for mp in self.mps.values()}
+        total_statements = 0
+        unique_speakers = set()
+        dates = []
+        statements_by_club = Counter()
+        for path in sorted(self.statements_dir.glob('*.jsonl')):
+            dates.append(path.stem)
+            with open(path, 'rb') as f:
+                for line in f:
+                    statement = orjson.loads(line)
+                    total_statements += 1
+                    unique_speakers.add(statement['speaker_name'])
+                    club = mp_club.get(statement['speaker_mp_id'])
+                    if club:
+                        statements_by_club[club] += 1
+
+        return {
+            'total_mps': len(self.mps),
+            'total_statements': total_statements,
+            'unique_speakers': len(unique_speakers),
+            'date_range': {
+                'from': dates[0] if dates else None,
+                'to': dates[-1] if dates else None
+            },
+            'statements_by_club': dict(statements_by_club.most_common())
+        }
+
+    def _load_processed_statements(self) -> set:
+        """Load processed statements IDs from file"""
         if self.processed_file.exists():
-            with open(self.processed_file, 'r') as f:
-                return set(json.load(f))
+            return set(orjson.loads(self.processed_file.read_bytes()))
         return set()
 
     def _load_mps(self) -> Dict[str, Any]:
         """Load MPs from file"""
         if self.mps_file.exists():
-            with open(self.mps_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return orjson.loads(self.mps_file.read_bytes())
         return {}
-
-    def _mark_processed(self, statements_id: str) -> None:
-        """Mark statements as processed"""
-        processed = self.get_processed_statements()
-        processed.add(statements_id)
-
-        with open(self.processed_file, 'w') as f:
-            json.dump(list(processed), f)
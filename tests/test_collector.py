@@ -0,0 +1,37 @@
+"""Equivalence of the regex paragraph fast path and the HTML parser"""
+import pytest
+
+pytest.importorskip("selectolax")
+
+from src.collector import _extract_plain_paragraphs, _parse_paragraphs
+
+SIMPLE = [
+    '<p class="mowca">Poseł Jan Kowalski:</p><p>Panie Marszałku!</p><p>Wysoka Izbo!</p>',
+    '<P>Upper case</P><p class=\'x\'>meta</p>',
+    '<p>Entities &amp; &quot;quotes&quot; &oacute;</p>\r\n<p>   </p><p>line\r\nbreak</p>',
+]
+
+COMPLEX = [
+    '<p>a<div>b</div>c</p>',
+    '<p>x < 5 and y > 3</p>',
+    '<p title="a>b">t</p>',
+    '<script>"<p>z</p>"</script>',
+    '<p>a <b>bold</b> text</p>',
+    '<p class="">empty class</p><p>plain</p>',
+    '<p title=" class=x">hidden</p><p>plain</p>',
+    '<p>unclosed<p>second</p>',
+    '<!-- <p>comment</p> --><p>kept</p>',
+]
+
+
+@pytest.mark.parametrize("html_content", SIMPLE)
+def test_fast_path_matches_parser(html_content):
+    fast = _extract_plain_paragraphs(html_content)
+    assert fast is not None
+    assert fast == _parse_paragraphs(html_content)
+
+
+@pytest.mark.parametrize("html_content", COMPLEX)
+def test_complex_markup_is_left_to_parser_or_matches(html_content):
+    fast = _extract_plain_paragraphs(html_content)
+    assert fast is None or fast == _parse_paragraphs(html_content)
@@ -0,0 +1,129 @@
+"""CSV storage start-up migrations and writer thread behaviour"""
+import csv
+import os
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+from src.models import Statement
+from src.storage import CSVStorage, StatementRow
+
+BASELINE_HEADER = [
+    'unique_id', 'term', 'proceeding_num', 'proceeding_date', 'statement_num',
+    'speaker_name', 'speaker_mp_id', 'speaker_function', 'start_time', 'end_time',
+    'content_text', 'content_html', 'is_unspoken', 'collected_at'
+]
+
+
+def make_statement(statement_num, speaker_name="Jan Kowalski"):
+    return Statement(
+        term=10,
+        proceeding_num=1,
+        proceeding_date="2024-01-10",
+        statement_num=statement_num,
+        speaker_name=speaker_name,
+        speaker_mp_id=5,
+        content_text="Panie Marszałku! (Oklaski)",
+        content_clean_v1="panie marszałku!"
+    )
+
+
+def write_csv(path, header, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def read_csv(path):
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+
+def test_baseline_header_is_migrated(tmp_path):
+    write_csv(tmp_path / "statements.csv", BASELINE_HEADER, [[
+        '10_1_2024-01-10_1', '10', '1', '2024-01-10', '1', 'Jan Kowalski', '5',
+        'Poseł', '', '', 'Tekst', '<p>Tekst</p>', 'False', '2024-01-11T10:00:00'
+    ]])
+
+    storage = CSVStorage(tmp_path, batch_size=10)
+    storage.save_statement(make_statement(2))
+    storage.close()
+
+    header, *rows = read_csv(tmp_path / "statements.csv")
+    # Current columns first, unknown columns of the old file are kept after them
+    assert header == list(StatementRow._fields) + ['content_html']
+    old_row = dict(zip(header, rows[0]))
+    assert old_row['content_text'] == 'Tekst'
+    assert old_row['content_clean_v1'] == ''
+    assert old_row['content_html'] == '<p>Tekst</p>'
+    new_row = dict(zip(header, rows[1]))
+    assert new_row['content_clean_v1'] == 'panie marszałku!'
+    assert new_row['content_html'] == ''
+    assert storage.get_statistics()['total_statements'] == 2
+
+
+def test_stale_sidecar_is_rebuilt(tmp_path):
+    statements_file = tmp_path / "statements.csv"
+    processed_file = tmp_path / "processed_statements.txt"
+    write_csv(statements_file, list(StatementRow._fields), [
+        ['10_1_2024-01-10_1', '10', '1', '2024-01-10', '1', '5', 'Jan Kowalski',
+         '', '', '', 'a', 'a', 'False', ''],
+        ['10_1_2024-01-10_2', '10', '1', '2024-01-10', '2', '5', 'Jan Kowalski',
+         '', '', '', 'b', 'b', 'False', ''],
+    ])
+    # Only the first row was synced before a crash
+    processed_file.write_text('10_1_2024-01-10_1\n', encoding='utf-8')
+    stat = statements_file.stat()
+    os.utime(processed_file, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+
+    storage = CSVStorage(tmp_path, batch_size=10)
+    storage.close()
+
+    expected = {'10_1_2024-01-10_1', '10_1_2024-01-10_2'}
+    assert storage.get_processed_statements() == expected
+    assert set(processed_file.read_text(encoding='utf-8').split()) == expected
+
+
+def test_sidecar_without_statements_file_is_discarded(tmp_path):
+    processed_file = tmp_path / "processed_statements.txt"
+    processed_file.write_text('10_1_2024-01-10_1\n', encoding='utf-8')
+
+    storage = CSVStorage(tmp_path, batch_size=10)
+    storage.close()
+
+    assert storage.get_processed_statements() == set()
+    assert not processed_file.exists()
+
+
+def test_write_error_surfaces_from_flush_all(tmp_path, monkeypatch):
+    storage = CSVStorage(tmp_path, batch_size=10)
+
+    def fail(rows):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(storage, "_write_statements", fail)
+    storage.save_statement(make_statement(1))
+
+    with pytest.raises(OSError, match="disk full"):
+        storage.flush_all()
+
+    # The error is reported once, the writer thread keeps serving requests
+    storage.flush_all()
+    monkeypatch.undo()
+    storage.close()
+
+
+def test_statistics_are_persisted(tmp_path):
+    storage = CSVStorage(tmp_path, batch_size=10)
+    storage.save_statement(make_statement(1))
+    storage.save_statement(make_statement(2, speaker_name="Anna Nowak"))
+    storage.close()
+    statistics = storage.get_statistics()
+
+    assert statistics['total_statements'] == 2
+    assert statistics['unique_speakers'] == 2
+    assert (tmp_path / "statements_statistics.json").exists()
+    assert CSVStorage(tmp_path, batch_size=10).get_statistics() == statistics